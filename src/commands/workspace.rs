@@ -1,5 +1,6 @@
 use anyhow::{Context, Result};
 use clap::Subcommand;
+use std::io::Write;
 use std::path::Path;
 
 use crate::git;
@@ -7,7 +8,7 @@ use crate::models;
 use crate::ui;
 
 /// Validate and load repository configuration from JSON file
-fn load_and_validate_repos(repos_file: &Path) -> Result<Vec<models::Repository>> {
+pub fn load_and_validate_repos(repos_file: &Path) -> Result<Vec<models::Repository>> {
     let repos_json = std::fs::read_to_string(repos_file).with_context(|| {
         format!(
             "Failed to read configuration file: {}",
@@ -15,7 +16,32 @@ fn load_and_validate_repos(repos_file: &Path) -> Result<Vec<models::Repository>>
         )
     })?;
 
-    let mut repositories: Vec<models::Repository> = serde_json::from_str(&repos_json)
+    parse_and_validate_repos(&repos_json, repos_file)
+}
+
+/// Write repository configuration to JSON file
+pub fn save_repositories(repos_file: &Path, repositories: &[models::Repository]) -> Result<()> {
+    let write_config = || -> Result<()> {
+        let mut writer = std::io::BufWriter::new(std::fs::File::create(repos_file)?);
+        serde_json::to_writer_pretty(&mut writer, repositories)?;
+        writer.flush()?;
+        Ok(())
+    };
+
+    write_config().with_context(|| {
+        format!(
+            "Failed to write configuration file: {}",
+            repos_file.display()
+        )
+    })
+}
+
+/// Parse and validate repository configuration JSON read from `repos_file`
+pub fn parse_and_validate_repos(
+    repos_json: &str,
+    repos_file: &Path,
+) -> Result<Vec<models::Repository>> {
+    let mut repositories: Vec<models::Repository> = serde_json::from_str(repos_json)
         .with_context(|| {
             format!(
                 "Invalid JSON in configuration file: {}\n\
@@ -56,8 +82,8 @@ fn load_and_validate_repos(repos_file: &Path) -> Result<Vec<models::Repository>>
         }
 
         // Basic URL validation - should contain git-like patterns
-        if !repo.url.contains("git") && !repo.url.contains("github") && !repo.url.contains("gitlab")
-        {
+        // ("github" and "gitlab" both contain "git", so one scan covers all three hosts)
+        if !repo.url.contains("git") {
             ui::print_warning(&format!(
                 "Repository '{}' has unusual URL format: {}\n\
                 This might not be a valid Git repository URL",
@@ -124,12 +150,8 @@ fn workspace_status() -> Result<()> {
 
     ui::print_info("");
 
-    // Collect branch information for consistency check
-    let mut repo_branches = Vec::new();
-    let mut clean_count = 0;
-    let mut dirty_count = 0;
-    let mut ahead_count = 0;
-
+    // Validate repositories first (this may print warnings or configure git users)
+    let mut repos_to_check = Vec::new();
     for repo in &view_context.active_repos {
         let repo_path = view_context.view_root.join(&repo.name);
 
@@ -145,18 +167,48 @@ fn workspace_status() -> Result<()> {
             // Continue with status check even if git config has issues
         }
 
-        // Get branch for consistency check
-        let branch = git::get_current_branch(&repo_path).unwrap_or_else(|_| "unknown".to_string());
+        repos_to_check.push((repo, repo_path));
+    }
+
+    // Query each repository's git state in parallel; results keep the view's repo order
+    let repo_states: Vec<(String, Result<Option<RepoStatus>>)> = std::thread::scope(|scope| {
+        // Spawn every query before joining any of them
+        let mut handles = Vec::with_capacity(repos_to_check.len());
+        for (repo, repo_path) in &repos_to_check {
+            handles.push(scope.spawn(move || {
+                let branch =
+                    git::get_current_branch(repo_path).unwrap_or_else(|_| "unknown".to_string());
+                let status = get_repo_status(repo_path, &repo.name, &branch);
+                (branch, status)
+            }));
+        }
+
+        handles
+            .into_iter()
+            .map(|handle| {
+                handle
+                    .join()
+                    .unwrap_or_else(|panic| std::panic::resume_unwind(panic))
+            })
+            .collect()
+    });
+
+    // Collect branch information for consistency check
+    let mut repo_branches = Vec::new();
+    let mut clean_count = 0;
+    let mut dirty_count = 0;
+    let mut ahead_count = 0;
+
+    for ((repo, _), (branch, status)) in repos_to_check.iter().zip(repo_states) {
         repo_branches.push((repo.name.clone(), branch.clone()));
 
-        // Get repository status
-        match get_repo_status(&repo_path, &repo.name) {
+        match status {
             Ok(Some(status)) => {
-                println!("{status}");
-                if status.contains("changes") {
+                println!("{}", status.line);
+                if status.has_changes {
                     dirty_count += 1;
                 }
-                if status.contains("ahead") {
+                if status.has_unpushed {
                     ahead_count += 1;
                 }
             }
@@ -531,10 +583,18 @@ struct ViewContext {
     active_repos: Vec<models::Repository>,
 }
 
+/// One-line status of a repository that is not completely clean
+#[derive(Debug)]
+struct RepoStatus {
+    line: String,
+    has_changes: bool,
+    has_unpushed: bool,
+}
+
 fn load_view_context(current_dir: &Path) -> Result<ViewContext> {
     // Check if current directory is a view (parent contains .viewyard-repos.json)
     if let Some(parent) = current_dir.parent() {
-        let repos_file = parent.join(".viewyard-repos.json");
+        let repos_file = parent.join(models::REPOS_FILE_NAME);
         if repos_file.exists() {
             let viewset_name = parent
                 .file_name()
@@ -587,16 +647,14 @@ fn load_view_context(current_dir: &Path) -> Result<ViewContext> {
     anyhow::bail!("Not in a view directory")
 }
 
-fn get_repo_status(repo_path: &Path, repo_name: &str) -> Result<Option<String>> {
-    // Get current branch
-    let branch = git::get_current_branch(repo_path)
-        .with_context(|| format!("Failed to get current branch for repository '{repo_name}'"))?;
+fn get_repo_status(repo_path: &Path, repo_name: &str, branch: &str) -> Result<Option<RepoStatus>> {
+    // Count uncommitted changes
+    let change_count = git::get_status(repo_path)?.lines().count();
+    let has_changes = change_count > 0;
 
-    // Check for uncommitted changes
-    let has_changes = git::has_uncommitted_changes(repo_path)?;
-
-    // Check for unpushed commits
-    let has_unpushed = git::has_unpushed_commits(repo_path)?;
+    // Count unpushed commits
+    let unpushed_count = git::count_unpushed_commits(repo_path)?;
+    let has_unpushed = unpushed_count > 0;
 
     // Check for stashes
     let stash_count = git::get_stash_count(repo_path)?;
@@ -610,50 +668,26 @@ fn get_repo_status(repo_path: &Path, repo_name: &str) -> Result<Option<String>>
     let mut status_parts = Vec::new();
 
     if has_changes {
-        // Count changes
-        match git::get_status(repo_path) {
-            Ok(status_output) => {
-                let change_count = status_output.lines().count();
-                if change_count > 0 {
-                    status_parts.push(format!("{change_count} changes"));
-                }
-            }
-            Err(_) => {
-                status_parts.push("changes".to_string());
-            }
-        }
+        status_parts.push(format!("{change_count} changes"));
     }
 
     if has_unpushed {
-        match git::run_git_command_string(&["rev-list", "--count", "@{u}..HEAD"], Some(repo_path)) {
-            Ok(count_str) => {
-                if let Ok(count) = count_str.parse::<u32>() {
-                    if count > 0 {
-                        status_parts.push(format!("{count} commits ahead"));
-                    }
-                }
-            }
-            Err(_) => {
-                status_parts.push("commits ahead".to_string());
-            }
-        }
+        status_parts.push(format!("{unpushed_count} commits ahead"));
     }
 
     if stash_count > 0 {
         status_parts.push(format!("{stash_count} stashes"));
     }
 
-    let status_summary = if status_parts.is_empty() {
-        "clean".to_string()
-    } else {
-        status_parts.join(", ")
-    };
+    let status_summary = status_parts.join(", ");
 
     let icon = if has_changes { "!" } else { "→" };
 
-    Ok(Some(format!(
-        "{icon} {repo_name} ({branch}) - {status_summary}"
-    )))
+    Ok(Some(RepoStatus {
+        line: format!("{icon} {repo_name} ({branch}) - {status_summary}"),
+        has_changes,
+        has_unpushed,
+    }))
 }
 
 fn check_branch_consistency(repo_branches: &[(String, String)]) {
@@ -662,13 +696,10 @@ fn check_branch_consistency(repo_branches: &[(String, String)]) {
     }
 
     // Group repos by branch
-    let mut branch_groups: std::collections::HashMap<String, Vec<String>> =
+    let mut branch_groups: std::collections::HashMap<&str, Vec<&str>> =
         std::collections::HashMap::new();
     for (repo, branch) in repo_branches {
-        branch_groups
-            .entry(branch.clone())
-            .or_default()
-            .push(repo.clone());
+        branch_groups.entry(branch).or_default().push(repo);
     }
 
     if branch_groups.len() > 1 {
@@ -1,19 +1,48 @@
 use crate::ui;
 use anyhow::Result;
 
+type CloneErrorHandler = fn(&str) -> Result<()>;
+
+/// Known clone failures, matched in order against git's stderr
+const CLONE_ERROR_HANDLERS: &[(&[&str], CloneErrorHandler)] = &[
+    (&["Permission denied", "publickey"], show_ssh_auth_error),
+    (&["not found", "does not exist"], show_repo_not_found_error),
+    (&["timeout", "network"], show_network_error),
+    (&["already exists"], show_directory_exists_error),
+];
+
 /// Handle git clone errors with specific recovery guidance
 pub fn handle_clone_error(repo_name: &str, stderr: &str) -> Result<()> {
-    if stderr.contains("Permission denied") || stderr.contains("publickey") {
-        show_ssh_auth_error(repo_name)
-    } else if stderr.contains("not found") || stderr.contains("does not exist") {
-        show_repo_not_found_error(repo_name)
-    } else if stderr.contains("timeout") || stderr.contains("network") {
-        show_network_error(repo_name)
-    } else if stderr.contains("already exists") {
-        show_directory_exists_error(repo_name)
-    } else {
-        show_generic_clone_error(repo_name, stderr)
+    CLONE_ERROR_HANDLERS
+        .iter()
+        .find(|(patterns, _)| patterns.iter().any(|pattern| stderr.contains(pattern)))
+        .map_or_else(
+            || show_generic_clone_error(repo_name, stderr),
+            |(_, handler)| handler(repo_name),
+        )
+}
+
+type RepoListErrorHandler = fn() -> Result<()>;
+
+/// Known `gh repo list` failures, matched in order against gh's stderr
+const REPO_LIST_ERROR_HANDLERS: &[(&[&str], RepoListErrorHandler)] = &[
+    (
+        &["authentication", "not authenticated"],
+        show_github_auth_error,
+    ),
+    (&["rate limit"], show_rate_limit_error),
+    (&["network", "timeout"], show_github_network_error),
+];
+
+/// Handle `gh repo list` errors with specific recovery guidance
+pub fn handle_repo_list_error(account: &str, stderr: &str) -> Result<()> {
+    if let Some((_, handler)) = REPO_LIST_ERROR_HANDLERS
+        .iter()
+        .find(|(patterns, _)| patterns.iter().any(|pattern| stderr.contains(pattern)))
+    {
+        return handler();
     }
+    anyhow::bail!("Failed to list repositories for account '{account}': {stderr}")
 }
 
 /// Handle git branch creation errors
@@ -77,6 +106,33 @@ fn show_generic_clone_error(repo_name: &str, stderr: &str) -> Result<()> {
     anyhow::bail!("Failed to clone repository '{repo_name}': {stderr}")
 }
 
+fn show_github_auth_error() -> Result<()> {
+    ui::print_error("❌ GitHub CLI authentication failed");
+    ui::print_info("🔑 Authentication issues:");
+    ui::print_info("   • Re-authenticate: gh auth login");
+    ui::print_info("   • Check auth status: gh auth status");
+    ui::print_info("   • Refresh token: gh auth refresh");
+    anyhow::bail!("GitHub CLI authentication failed")
+}
+
+fn show_rate_limit_error() -> Result<()> {
+    ui::print_error("❌ GitHub API rate limit exceeded");
+    ui::print_info("⏰ Rate limit issues:");
+    ui::print_info("   • Wait for rate limit reset (usually 1 hour)");
+    ui::print_info("   • Check rate limit: gh api rate_limit");
+    ui::print_info("   • Use personal access token for higher limits");
+    anyhow::bail!("GitHub API rate limit exceeded")
+}
+
+fn show_github_network_error() -> Result<()> {
+    ui::print_error("❌ Network error accessing GitHub");
+    ui::print_info("🌐 Network issues:");
+    ui::print_info("   • Check internet connection");
+    ui::print_info("   • Try again in a few moments");
+    ui::print_info("   • Check GitHub status: https://www.githubstatus.com/");
+    anyhow::bail!("Network error accessing GitHub")
+}
+
 fn show_branch_exists_error(branch_name: &str) -> Result<()> {
     ui::print_error(&format!("Branch '{branch_name}' already exists"));
     ui::print_info("Branch conflict:");
@@ -2,8 +2,11 @@ use anyhow::{Context, Result};
 use std::collections::HashMap;
 use std::path::Path;
 use std::process::{Command, Output};
+use std::sync::OnceLock;
 use std::time::Duration;
 
+use crate::ui;
+
 // # Git Configuration Safety
 //
 // **CRITICAL SECURITY CONSTRAINT**: This module MUST NEVER modify global git configuration.
@@ -100,6 +103,11 @@ pub fn has_uncommitted_changes(cwd: &Path) -> Result<bool> {
 
 /// Check if repository has unpushed commits
 pub fn has_unpushed_commits(cwd: &Path) -> Result<bool> {
+    Ok(count_unpushed_commits(cwd)? > 0)
+}
+
+/// Count commits ahead of the upstream branch (0 when no upstream is configured)
+pub fn count_unpushed_commits(cwd: &Path) -> Result<u32> {
     // Get commits ahead of origin
     let output = run_git_command(&["rev-list", "--count", "@{u}..HEAD"], Some(cwd));
 
@@ -107,15 +115,14 @@ pub fn has_unpushed_commits(cwd: &Path) -> Result<bool> {
         Ok(output) => {
             if output.status.success() {
                 let count_str = String::from_utf8_lossy(&output.stdout).trim().to_string();
-                let count: u32 = count_str
+                count_str
                     .parse()
-                    .with_context(|| format!("Failed to parse commit count: '{count_str}'"))?;
-                Ok(count > 0)
+                    .with_context(|| format!("Failed to parse commit count: '{count_str}'"))
             } else {
                 // Check git exit code for specific error conditions
                 if output.status.code() == Some(128) {
                     // Exit code 128 typically means "no upstream configured"
-                    Ok(false) // No upstream branch means no unpushed commits
+                    Ok(0) // No upstream branch means no unpushed commits
                 } else {
                     let stderr = String::from_utf8_lossy(&output.stderr);
                     anyhow::bail!("Failed to check for unpushed commits: {stderr}")
@@ -231,50 +238,54 @@ pub fn get_default_branch(cwd: &Path) -> Result<String> {
 /// Returns a map of account -> SSH host (e.g., "dheater" -> "github.com-dheater")
 #[must_use]
 pub fn detect_ssh_host_aliases() -> HashMap<String, String> {
-    let mut aliases = HashMap::new();
-
     // Try to read SSH config file
-    let ssh_config_path = std::env::var("HOME").map_or_else(
-        |_| "/dev/null".to_string(),
-        |home| format!("{home}/.ssh/config"),
-    );
+    let Some(home) = std::env::var_os("HOME") else {
+        return HashMap::new();
+    };
+    let ssh_config_path = Path::new(&home).join(".ssh").join("config");
 
-    if let Ok(config_content) = std::fs::read_to_string(&ssh_config_path) {
-        let mut current_host: Option<String> = None;
-        let mut current_hostname: Option<String> = None;
-
-        for line in config_content.lines() {
-            let line = line.trim();
-
-            if let Some(host_part) = line.strip_prefix("Host ") {
-                // Process previous host if it was a GitHub alias
-                if let (Some(host), Some(hostname)) = (&current_host, &current_hostname) {
-                    if hostname == "github.com" && host.starts_with("github.com-") {
-                        // Extract account from host alias (e.g., "github.com-dheater" -> "dheater")
-                        if let Some(account) = host.strip_prefix("github.com-") {
-                            aliases.insert(account.to_string(), host.clone());
-                        }
-                    }
-                }
+    std::fs::read_to_string(ssh_config_path)
+        .map(|config_content| parse_ssh_host_aliases(&config_content))
+        .unwrap_or_default()
+}
 
-                // Start new host
-                current_host = Some(host_part.trim().to_string());
-                current_hostname = None;
-            } else if let Some(hostname_part) = line.strip_prefix("HostName ") {
-                current_hostname = Some(hostname_part.trim().to_string());
+/// SSH host alias prefix for per-account GitHub hosts (e.g., "github.com-dheater")
+const GITHUB_HOST_ALIAS_PREFIX: &str = "github.com-";
+
+/// Parse GitHub SSH host aliases from the contents of an SSH config file
+/// Returns a map of account -> SSH host (e.g., "dheater" -> "github.com-dheater")
+#[must_use]
+pub fn parse_ssh_host_aliases(config_content: &str) -> HashMap<String, String> {
+    let mut aliases = HashMap::new();
+    let mut current_host: Option<&str> = None;
+    let mut current_hostname: Option<&str> = None;
+
+    // Record a finished host block if it was a GitHub alias
+    let mut finish_host = |host: Option<&str>, hostname: Option<&str>| {
+        if let (Some(host), Some("github.com")) = (host, hostname) {
+            // Extract account from host alias (e.g., "github.com-dheater" -> "dheater")
+            if let Some(account) = host.strip_prefix(GITHUB_HOST_ALIAS_PREFIX) {
+                aliases.insert(account.to_string(), host.to_string());
             }
         }
+    };
 
-        // Process the last host
-        if let (Some(host), Some(hostname)) = (&current_host, &current_hostname) {
-            if hostname == "github.com" && host.starts_with("github.com-") {
-                if let Some(account) = host.strip_prefix("github.com-") {
-                    aliases.insert(account.to_string(), host.clone());
-                }
-            }
+    for line in config_content.lines() {
+        let line = line.trim();
+
+        if let Some(host_part) = line.strip_prefix("Host ") {
+            // Process previous host, then start the new one
+            finish_host(current_host, current_hostname);
+            current_host = Some(host_part.trim());
+            current_hostname = None;
+        } else if let Some(hostname_part) = line.strip_prefix("HostName ") {
+            current_hostname = Some(hostname_part.trim());
         }
     }
 
+    // Process the last host
+    finish_host(current_host, current_hostname);
+
     aliases
 }
 
@@ -282,12 +293,15 @@ pub fn detect_ssh_host_aliases() -> HashMap<String, String> {
 /// Returns the original URL if no alias is found or if it's not a GitHub SSH URL
 #[must_use]
 pub fn transform_github_url_for_account(url: &str, account: &str) -> String {
+    // Discovery transforms every listed repository, so read the SSH config once per process
+    static SSH_ALIASES: OnceLock<HashMap<String, String>> = OnceLock::new();
+
     // Only transform SSH URLs for github.com
     if !url.starts_with("git@github.com:") {
         return url.to_string();
     }
 
-    let ssh_aliases = detect_ssh_host_aliases();
+    let ssh_aliases = SSH_ALIASES.get_or_init(detect_ssh_host_aliases);
 
     ssh_aliases.get(account).map_or_else(
         || url.to_string(),
@@ -380,16 +394,18 @@ pub fn get_global_git_config(key: &str) -> Result<String> {
     get_git_config_scoped(key, GitConfigScope::GlobalReadOnly, None)
 }
 
-/// Detect available signing key from global git configuration
+/// Detect available signing key from global git configuration (looked up once per process)
 #[must_use]
-pub fn detect_signing_key() -> Option<String> {
-    // Try to get signing key from global config
-    if let Ok(signing_key) = get_global_git_config("user.signingkey") {
-        if !signing_key.trim().is_empty() {
-            return Some(signing_key.trim().to_string());
-        }
-    }
-    None
+pub fn detect_signing_key() -> Option<&'static str> {
+    static SIGNING_KEY: OnceLock<Option<String>> = OnceLock::new();
+    SIGNING_KEY
+        .get_or_init(|| {
+            get_global_git_config("user.signingkey")
+                .ok()
+                .map(|signing_key| signing_key.trim().to_string())
+                .filter(|signing_key| !signing_key.is_empty())
+        })
+        .as_deref()
 }
 
 /// Validate and configure git user settings for a repository
@@ -420,11 +436,12 @@ pub fn validate_and_configure_git_user(repo_path: &Path, account: &str) -> Resul
     };
 
     // Configure signing key if available and not already set
-    let signing_key_configured = if let Some(global_signing_key) = detect_signing_key() {
-        if current_signing_key.as_deref() == Some(&global_signing_key) {
+    let global_signing_key = detect_signing_key();
+    let signing_key_configured = if let Some(global_signing_key) = global_signing_key {
+        if current_signing_key.as_deref() == Some(global_signing_key) {
             false
         } else {
-            set_git_config("user.signingkey", &global_signing_key, repo_path).with_context(
+            set_git_config("user.signingkey", global_signing_key, repo_path).with_context(
                 || format!("Failed to set user.signingkey to '{global_signing_key}'"),
             )?;
             true
@@ -435,16 +452,15 @@ pub fn validate_and_configure_git_user(repo_path: &Path, account: &str) -> Resul
 
     // Provide feedback about what was configured
     if name_configured || email_configured || signing_key_configured {
-        use crate::ui;
         let mut config_parts = vec![format!("{account} <{expected_email}>")];
 
         if signing_key_configured {
-            if let Some(signing_key) = detect_signing_key() {
+            if let Some(signing_key) = global_signing_key {
                 // Show a shortened version of the signing key for readability
                 let key_display = if signing_key.len() > 20 {
                     format!("{}...", &signing_key[..20])
                 } else {
-                    signing_key
+                    signing_key.to_string()
                 };
                 config_parts.push(format!("signing: {key_display}"));
             }
@@ -491,15 +507,16 @@ pub fn validate_repository_for_operations(
 
 /// Validate that a directory exists and is accessible
 pub fn validate_repository_directory(repo_path: &Path, repo_name: &str) -> Result<()> {
-    if !repo_path.exists() {
+    // One stat covers both checks
+    let Ok(metadata) = std::fs::metadata(repo_path) else {
         anyhow::bail!(
             "Repository directory '{}' does not exist: {}",
             repo_name,
             repo_path.display()
         );
-    }
+    };
 
-    if !repo_path.is_dir() {
+    if !metadata.is_dir() {
         anyhow::bail!(
             "Repository path '{}' is not a directory: {}",
             repo_name,
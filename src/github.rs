@@ -1,11 +1,86 @@
 use anyhow::{Context, Result};
+use serde::Deserialize;
 use std::process::Command;
 
 use crate::models::Repository;
+use crate::{error_handling, git, ui};
 
 #[derive(Debug)]
 pub struct GitHubService;
 
+/// Repository entry from `gh repo list --json name,sshUrl,isPrivate`
+#[derive(Deserialize)]
+#[serde(rename_all = "camelCase")]
+struct GhRepo {
+    name: Option<String>,
+    ssh_url: Option<String>,
+    is_private: Option<bool>,
+}
+
+/// Convert `gh repo list` entries into repositories for `account`, skipping incomplete entries
+/// `owner` is shown in the source label (e.g., "dheater" or "org/dheater")
+fn repositories_from_gh_list(gh_repos: Vec<GhRepo>, owner: &str, account: &str) -> Vec<Repository> {
+    gh_repos
+        .into_iter()
+        .filter_map(|gh_repo| {
+            let (Some(name), Some(url), Some(is_private)) =
+                (gh_repo.name, gh_repo.ssh_url, gh_repo.is_private)
+            else {
+                return None;
+            };
+            let privacy_indicator = if is_private { " [private]" } else { "" };
+
+            Some(Repository {
+                name,
+                // Transform URL to use SSH host alias if available
+                url: git::transform_github_url_for_account(&url, account),
+                is_private,
+                source: format!("GitHub ({owner}){privacy_indicator}"),
+                account: Some(account.to_string()),
+            })
+        })
+        .collect()
+}
+
+/// Extract logged-in account names from `gh auth status` output
+#[must_use]
+pub fn parse_auth_status(status_output: &str) -> Vec<String> {
+    status_output
+        .lines()
+        .filter_map(logged_in_account)
+        .map(str::to_string)
+        .collect()
+}
+
+/// Extract the active account from `gh auth status` output
+#[must_use]
+pub fn parse_active_account(status_output: &str) -> Option<String> {
+    let mut account = None;
+
+    for line in status_output.lines() {
+        if let Some(logged_in) = logged_in_account(line) {
+            account = Some(logged_in);
+        } else if line.trim() == "- Active account: true" {
+            return account.map(str::to_string);
+        }
+    }
+
+    None
+}
+
+/// Account name from a "Logged in to github.com account" status line
+fn logged_in_account(line: &str) -> Option<&str> {
+    if !line.contains("✓ Logged in to github.com account") {
+        return None;
+    }
+
+    line.split("account ")
+        .nth(1)
+        .and_then(|account_part| account_part.split(' ').next())
+        .map(str::trim)
+        .filter(|account| !account.is_empty())
+}
+
 impl GitHubService {
     /// Check if GitHub CLI is available and authenticated
     pub fn check_availability() -> Result<bool> {
@@ -27,34 +102,18 @@ impl GitHubService {
         Ok(auth_output.status.success())
     }
 
-    /// Get list of available GitHub accounts
-    pub fn get_available_accounts() -> Result<Vec<String>> {
+    /// Get `gh auth status` output (empty when not authenticated)
+    fn get_auth_status() -> Result<String> {
         let output = Command::new("gh")
             .args(["auth", "status"])
             .output()
             .context("Failed to get GitHub auth status")?;
 
         if !output.status.success() {
-            return Ok(Vec::new());
+            return Ok(String::new());
         }
 
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        let mut accounts = Vec::new();
-
-        for line in stdout.lines() {
-            if line.contains("✓ Logged in to github.com account") {
-                if let Some(account_part) = line.split("account ").nth(1) {
-                    if let Some(account) = account_part.split(' ').next() {
-                        let account = account.trim();
-                        if !account.is_empty() {
-                            accounts.push(account.to_string());
-                        }
-                    }
-                }
-            }
-        }
-
-        Ok(accounts)
+        Ok(String::from_utf8_lossy(&output.stdout).into_owned())
     }
 
     /// Get current authenticated account
@@ -89,8 +148,6 @@ impl GitHubService {
 
     /// Discover repositories from a specific GitHub account
     pub fn discover_repositories_from_account(account: &str) -> Result<Vec<Repository>> {
-        use crate::ui;
-
         let mut repos = Vec::new();
 
         // Switch to the specified account first
@@ -141,68 +198,15 @@ impl GitHubService {
 
         if !output.status.success() {
             let stderr = String::from_utf8_lossy(&output.stderr);
-
-            if stderr.contains("authentication") || stderr.contains("not authenticated") {
-                use crate::ui;
-                ui::print_error("❌ GitHub CLI authentication failed");
-                ui::print_info("🔑 Authentication issues:");
-                ui::print_info("   • Re-authenticate: gh auth login");
-                ui::print_info("   • Check auth status: gh auth status");
-                ui::print_info("   • Refresh token: gh auth refresh");
-                anyhow::bail!("GitHub CLI authentication failed");
-            } else if stderr.contains("rate limit") || stderr.contains("API rate limit") {
-                use crate::ui;
-                ui::print_error("❌ GitHub API rate limit exceeded");
-                ui::print_info("⏰ Rate limit issues:");
-                ui::print_info("   • Wait for rate limit reset (usually 1 hour)");
-                ui::print_info("   • Check rate limit: gh api rate_limit");
-                ui::print_info("   • Use personal access token for higher limits");
-                anyhow::bail!("GitHub API rate limit exceeded");
-            } else if stderr.contains("network") || stderr.contains("timeout") {
-                use crate::ui;
-                ui::print_error("❌ Network error accessing GitHub");
-                ui::print_info("🌐 Network issues:");
-                ui::print_info("   • Check internet connection");
-                ui::print_info("   • Try again in a few moments");
-                ui::print_info("   • Check GitHub status: https://www.githubstatus.com/");
-                anyhow::bail!("Network error accessing GitHub");
-            }
-            anyhow::bail!(
-                "Failed to list repositories for account '{}': {}",
-                account,
-                stderr
-            );
+            error_handling::handle_repo_list_error(account, &stderr)?;
         }
 
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        let repos_json: Vec<serde_json::Value> =
-            serde_json::from_str(&stdout).context("Failed to parse user repositories JSON")?;
-
-        let mut repos = Vec::new();
-        for repo_data in repos_json {
-            if let (Some(name), Some(url), Some(is_private)) = (
-                repo_data["name"].as_str(),
-                repo_data["sshUrl"].as_str(),
-                repo_data["isPrivate"].as_bool(),
-            ) {
-                let privacy_indicator = if is_private { " [private]" } else { "" };
-
-                // Transform URL to use SSH host alias if available
-                let transformed_url = crate::git::transform_github_url_for_account(url, account);
-
-                repos.push(Repository {
-                    name: name.to_string(),
-                    url: transformed_url,
-                    is_private,
-                    source: format!("GitHub ({account}){privacy_indicator}"),
-                    account: Some(account.to_string()),
-                });
-            }
-        }
+        let gh_repos: Vec<GhRepo> = serde_json::from_slice(&output.stdout)
+            .context("Failed to parse user repositories JSON")?;
+        let repos = repositories_from_gh_list(gh_repos, account, account);
 
         // Warn if we might have hit the limit
         if repos.len() >= 1000 {
-            use crate::ui;
             ui::print_warning(&format!("    Warning: Found exactly 1000 repositories for {account}. Some repositories may not be shown due to GitHub CLI limits."));
         }
 
@@ -228,14 +232,12 @@ impl GitHubService {
             .collect();
 
         if !orgs.is_empty() {
-            use crate::ui;
             ui::print_info(&format!("    Found {} organizations to check", orgs.len()));
         }
 
         let mut all_repos = Vec::new();
 
         for (i, org) in orgs.iter().enumerate() {
-            use crate::ui;
             ui::print_info(&format!(
                 "    Checking organization {} ({}/{})",
                 org,
@@ -276,35 +278,12 @@ impl GitHubService {
             return Ok(Vec::new());
         }
 
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        let repos_json: Vec<serde_json::Value> = serde_json::from_str(&stdout)
+        let gh_repos: Vec<GhRepo> = serde_json::from_slice(&output.stdout)
             .context("Failed to parse organization repositories JSON")?;
-
-        let mut repos = Vec::new();
-        for repo_data in repos_json {
-            if let (Some(name), Some(url), Some(is_private)) = (
-                repo_data["name"].as_str(),
-                repo_data["sshUrl"].as_str(),
-                repo_data["isPrivate"].as_bool(),
-            ) {
-                let privacy_indicator = if is_private { " [private]" } else { "" };
-
-                // Transform URL to use SSH host alias if available
-                let transformed_url = crate::git::transform_github_url_for_account(url, account);
-
-                repos.push(Repository {
-                    name: name.to_string(),
-                    url: transformed_url,
-                    is_private,
-                    source: format!("GitHub ({org}/{account}){privacy_indicator}"),
-                    account: Some(account.to_string()),
-                });
-            }
-        }
+        let repos = repositories_from_gh_list(gh_repos, &format!("{org}/{account}"), account);
 
         // Warn if we might have hit the limit
         if repos.len() >= 1000 {
-            use crate::ui;
             ui::print_warning(&format!("        Warning: Found exactly 1000 repositories for organization '{org}'. Some repositories may not be shown due to GitHub CLI limits."));
         }
 
@@ -313,14 +292,16 @@ impl GitHubService {
 
     /// Discover all repositories from all available accounts
     pub fn discover_all_repositories() -> Result<Vec<Repository>> {
-        let accounts = Self::get_available_accounts()?;
+        let auth_status = Self::get_auth_status()?;
+        let accounts = parse_auth_status(&auth_status);
 
         if accounts.is_empty() {
             anyhow::bail!("No GitHub accounts found. Please run 'gh auth login' first.");
         }
 
-        // Remember current account to restore later
-        let original_account = Self::get_current_account().ok();
+        // Remember current account to restore later (older gh versions don't report it in auth status)
+        let original_account =
+            parse_active_account(&auth_status).or_else(|| Self::get_current_account().ok());
 
         let mut all_repos = Vec::new();
 
@@ -1,6 +1,7 @@
 use crate::models::Repository;
 use crate::search::RepositorySearch;
 use anyhow::Result;
+use std::collections::HashSet;
 use std::io::{self, Write};
 
 pub struct InteractiveSelector {
@@ -40,6 +41,7 @@ impl InteractiveSelector {
         println!();
 
         let mut selected_repos: Vec<Repository> = Vec::new();
+        let mut selected_names: HashSet<String> = HashSet::new();
 
         loop {
             // Show current selection status
@@ -72,8 +74,8 @@ impl InteractiveSelector {
             }
 
             // Find matching repositories
-            let repos_to_show = if query == "all" {
-                repositories.to_vec()
+            let repos_to_show: Vec<&Repository> = if query == "all" {
+                repositories.iter().collect()
             } else {
                 let matches = self.search.search(repositories, query);
                 matches.into_iter().map(|(repo, _score)| repo).collect()
@@ -87,11 +89,8 @@ impl InteractiveSelector {
             // Filter out already selected repositories
             let available_repos: Vec<Repository> = repos_to_show
                 .into_iter()
-                .filter(|repo| {
-                    !selected_repos
-                        .iter()
-                        .any(|selected| selected.name == repo.name)
-                })
+                .filter(|repo| !selected_names.contains(&repo.name))
+                .cloned()
                 .collect();
 
             if available_repos.is_empty() {
@@ -130,6 +129,7 @@ impl InteractiveSelector {
                         let names: Vec<String> =
                             new_selections.iter().map(|r| r.name.clone()).collect();
                         println!("✓ Added: {}", names.join(", "));
+                        selected_names.extend(names);
                         selected_repos.extend(new_selections);
                     }
                 }
@@ -182,6 +182,7 @@ impl InteractiveSelector {
         }
 
         let mut selected = Vec::new();
+        let mut selected_names = HashSet::new();
         let max_index = available_repos.len();
 
         // Split by comma or space
@@ -216,10 +217,9 @@ impl InteractiveSelector {
                     return Err(format!("Invalid range: {start} is greater than {end}"));
                 }
 
-                for i in start..=end {
-                    let repo = available_repos[i - 1].clone();
-                    if !selected.iter().any(|r: &Repository| r.name == repo.name) {
-                        selected.push(repo);
+                for repo in &available_repos[start - 1..end] {
+                    if selected_names.insert(repo.name.as_str()) {
+                        selected.push(repo.clone());
                     }
                 }
             } else {
@@ -235,9 +235,9 @@ impl InteractiveSelector {
                     return Err(format!("Number must be between 1 and {max_index}"));
                 }
 
-                let repo = available_repos[index - 1].clone();
-                if !selected.iter().any(|r: &Repository| r.name == repo.name) {
-                    selected.push(repo);
+                let repo = &available_repos[index - 1];
+                if selected_names.insert(repo.name.as_str()) {
+                    selected.push(repo.clone());
                 }
             }
         }
@@ -289,77 +289,37 @@ mod tests {
     use super::*;
 
     fn create_test_repos() -> Vec<Repository> {
-        vec![
-            Repository {
-                name: "repo1".to_string(),
-                url: "git@github.com:user/repo1.git".to_string(),
+        ["repo1", "repo2", "repo3"]
+            .into_iter()
+            .map(|name| Repository {
+                name: name.to_string(),
+                url: format!("git@github.com:user/{name}.git"),
                 is_private: false,
                 source: "GitHub (user)".to_string(),
                 account: None,
-            },
-            Repository {
-                name: "repo2".to_string(),
-                url: "git@github.com:user/repo2.git".to_string(),
-                is_private: false,
-                source: "GitHub (user)".to_string(),
-                account: None,
-            },
-            Repository {
-                name: "repo3".to_string(),
-                url: "git@github.com:user/repo3.git".to_string(),
-                is_private: false,
-                source: "GitHub (user)".to_string(),
-                account: None,
-            },
-        ]
-    }
-
-    #[test]
-    fn test_parse_selection_single_number() {
-        let repos = create_test_repos();
-
-        let result = InteractiveSelector::parse_selection("2", &repos).unwrap();
-        assert_eq!(result.len(), 1);
-        assert_eq!(result[0].name, "repo2");
+            })
+            .collect()
     }
 
     #[test]
-    fn test_parse_selection_comma_separated() {
+    fn test_parse_selection_valid_inputs() {
         let repos = create_test_repos();
 
-        let result = InteractiveSelector::parse_selection("1,3", &repos).unwrap();
-        assert_eq!(result.len(), 2);
-        assert_eq!(result[0].name, "repo1");
-        assert_eq!(result[1].name, "repo3");
-    }
-
-    #[test]
-    fn test_parse_selection_space_separated() {
-        let repos = create_test_repos();
-
-        let result = InteractiveSelector::parse_selection("1 3", &repos).unwrap();
-        assert_eq!(result.len(), 2);
-        assert_eq!(result[0].name, "repo1");
-        assert_eq!(result[1].name, "repo3");
-    }
-
-    #[test]
-    fn test_parse_selection_range() {
-        let repos = create_test_repos();
-
-        let result = InteractiveSelector::parse_selection("1-3", &repos).unwrap();
-        assert_eq!(result.len(), 3);
-        assert_eq!(result[0].name, "repo1");
-        assert_eq!(result[1].name, "repo2");
-        assert_eq!(result[2].name, "repo3");
-    }
-
-    #[test]
-    fn test_parse_selection_all() {
-        let repos = create_test_repos();
-
-        let result = InteractiveSelector::parse_selection("all", &repos).unwrap();
-        assert_eq!(result.len(), 3);
+        // (selection input, expected repository names in order)
+        let cases: [(&str, &[&str]); 6] = [
+            ("2", &["repo2"]),
+            ("1,3", &["repo1", "repo3"]),
+            ("1 3", &["repo1", "repo3"]),
+            ("1-3", &["repo1", "repo2", "repo3"]),
+            ("all", &["repo1", "repo2", "repo3"]),
+            ("2,1-3", &["repo2", "repo1", "repo3"]), // Duplicates are selected once
+        ];
+
+        for (input, expected) in cases {
+            let result = InteractiveSelector::parse_selection(input, &repos).unwrap();
+            let names: Vec<&str> = result.iter().map(|repo| repo.name.as_str()).collect();
+            assert_eq!(names, expected, "selection: {input:?}");
+        }
     }
 
     #[test]
@@ -1,81 +1,10 @@
 use anyhow::{Context, Result};
 use clap::{Parser, Subcommand};
 
-mod commands;
-mod error_handling;
-mod git;
-mod github;
-mod interactive;
-mod models;
-mod search;
-mod ui;
-
-use commands::workspace;
-use github::GitHubService;
-use interactive::InteractiveSelector;
-
-/// Validate and load repository configuration from JSON file
-fn load_and_validate_repos(repos_file: &std::path::Path) -> Result<Vec<models::Repository>> {
-    let repos_json = std::fs::read_to_string(repos_file).with_context(|| {
-        format!(
-            "Failed to read configuration file: {}",
-            repos_file.display()
-        )
-    })?;
-
-    let mut repositories: Vec<models::Repository> = serde_json::from_str(&repos_json)
-        .with_context(|| {
-            format!(
-                "Invalid JSON in configuration file: {}\n\
-                Expected format: array of repository objects with 'name', 'url', 'is_private', and 'source' fields",
-                repos_file.display()
-            )
-        })?;
-
-    // Transform URLs to use SSH host aliases if available
-    for repo in &mut repositories {
-        if let Some(ref account) = repo.account {
-            repo.url = git::transform_github_url_for_account(&repo.url, account);
-        } else if let Ok(account) = git::extract_account_from_source(&repo.source) {
-            repo.url = git::transform_github_url_for_account(&repo.url, &account);
-        }
-    }
-
-    // Validate each repository entry
-    for (index, repo) in repositories.iter().enumerate() {
-        if repo.name.trim().is_empty() {
-            anyhow::bail!(
-                "Invalid repository at index {}: 'name' field cannot be empty\n\
-                File: {}",
-                index,
-                repos_file.display()
-            );
-        }
-
-        if repo.url.trim().is_empty() {
-            anyhow::bail!(
-                "Invalid repository at index {}: 'url' field cannot be empty\n\
-                Repository: {}\n\
-                File: {}",
-                index,
-                repo.name,
-                repos_file.display()
-            );
-        }
-
-        // Basic URL validation - should contain git-like patterns
-        if !repo.url.contains("git") && !repo.url.contains("github") && !repo.url.contains("gitlab")
-        {
-            ui::print_warning(&format!(
-                "Repository '{}' has unusual URL format: {}\n\
-                This might not be a valid Git repository URL",
-                repo.name, repo.url
-            ));
-        }
-    }
-
-    Ok(repositories)
-}
+use viewyard::commands::workspace;
+use viewyard::github::GitHubService;
+use viewyard::interactive::InteractiveSelector;
+use viewyard::{error_handling, git, models, ui};
 
 #[derive(Parser)]
 #[command(name = "viewyard")]
@@ -226,9 +155,8 @@ fn create_viewset(name: &str, account: Option<&str>) -> Result<()> {
     ));
 
     // Store repository list for the viewset
-    let repos_file = viewset_path.join(".viewyard-repos.json");
-    let repos_json = serde_json::to_string_pretty(&selected_repos)?;
-    std::fs::write(&repos_file, repos_json)?;
+    let repos_file = viewset_path.join(models::REPOS_FILE_NAME);
+    workspace::save_repositories(&repos_file, &selected_repos)?;
 
     ui::print_success(&format!(
         "Viewset '{}' created successfully with {} repositories!",
@@ -257,20 +185,8 @@ fn create_empty_viewset(viewset_path: &std::path::Path, name: &str, when: &str)
 }
 
 /// Load repositories from a viewset with validation
-fn load_viewset_repositories(viewset_root: &std::path::Path) -> Result<Vec<models::Repository>> {
-    let repos_file = viewset_root.join(".viewyard-repos.json");
-    if !repos_file.exists() {
-        ui::show_error_with_help(
-            "No repositories found in this viewset",
-            &[
-                "Manually edit .viewyard-repos.json to add repositories to this viewset",
-                "Or create a new viewset with 'viewyard viewset create <name>'",
-            ],
-        );
-        anyhow::bail!("No repositories in viewset");
-    }
-
-    let repositories = load_and_validate_repos(&repos_file)?;
+fn load_viewset_repositories(viewset_context: &ViewsetContext) -> Result<Vec<models::Repository>> {
+    let repositories = workspace::load_and_validate_repos(&viewset_context.repos_file)?;
 
     if repositories.is_empty() {
         ui::show_error_with_help(
@@ -302,14 +218,15 @@ fn create_view(view_name: &str) -> Result<()> {
     }
 
     // Load repository list from viewset
-    let repositories = load_viewset_repositories(&viewset_context.viewset_root)?;
+    let repositories = load_viewset_repositories(&viewset_context)?;
 
     // Create temporary directory for atomic operation
     let temp_view_path = view_path.with_extension("tmp");
 
     // Ensure temp directory doesn't exist from previous failed operation
-    if temp_view_path.exists() {
-        std::fs::remove_dir_all(&temp_view_path)?;
+    match std::fs::remove_dir_all(&temp_view_path) {
+        Err(e) if e.kind() != std::io::ErrorKind::NotFound => return Err(e.into()),
+        _ => {}
     }
 
     std::fs::create_dir_all(&temp_view_path)?;
@@ -366,25 +283,28 @@ fn create_view(view_name: &str) -> Result<()> {
 #[derive(Debug)]
 struct ViewsetContext {
     viewset_root: std::path::PathBuf,
+    repos_file: std::path::PathBuf,
 }
 
 fn detect_viewset_context() -> Result<ViewsetContext> {
     let current_dir = std::env::current_dir()?;
 
     // Check if current directory is a viewset root (contains .viewyard-repos.json)
-    let repos_file = current_dir.join(".viewyard-repos.json");
+    let repos_file = current_dir.join(models::REPOS_FILE_NAME);
     if repos_file.exists() {
         return Ok(ViewsetContext {
             viewset_root: current_dir,
+            repos_file,
         });
     }
 
     // Check if current directory is a view (parent contains .viewyard-repos.json)
     if let Some(parent) = current_dir.parent() {
-        let repos_file = parent.join(".viewyard-repos.json");
+        let repos_file = parent.join(models::REPOS_FILE_NAME);
         if repos_file.exists() {
             return Ok(ViewsetContext {
                 viewset_root: parent.to_path_buf(),
+                repos_file,
             });
         }
     }
@@ -505,7 +425,7 @@ fn update_view(view_name: Option<&str>) -> Result<()> {
     ui::print_info(&format!("Updating view: {target_view_name}"));
 
     // Load repository list from viewset
-    let Ok(repositories) = load_viewset_repositories(&viewset_context.viewset_root) else {
+    let Ok(repositories) = load_viewset_repositories(&viewset_context) else {
         ui::print_info("No repositories in viewset - nothing to update");
         return Ok(());
     };
@@ -562,16 +482,20 @@ fn find_missing_repositories(
     all_repos: &[models::Repository],
     view_path: &std::path::Path,
 ) -> Vec<models::Repository> {
-    let mut missing_repos = Vec::new();
-
-    for repo in all_repos {
-        let repo_path = view_path.join(&repo.name);
-        if !repo_path.exists() {
-            missing_repos.push(repo.clone());
-        }
-    }
+    // List the view directory once instead of checking each repository path separately
+    let present: std::collections::HashSet<std::ffi::OsString> = std::fs::read_dir(view_path)
+        .map(|entries| {
+            entries
+                .filter_map(|entry| entry.ok().map(|entry| entry.file_name()))
+                .collect()
+        })
+        .unwrap_or_default();
 
-    missing_repos
+    all_repos
+        .iter()
+        .filter(|repo| !present.contains(std::ffi::OsStr::new(&repo.name)))
+        .cloned()
+        .collect()
 }
 
 /// Clone and setup a single repository directly in an existing view
@@ -596,29 +520,7 @@ fn clone_and_setup_repository_in_view(
 
     if !output.status.success() {
         let stderr = String::from_utf8_lossy(&output.stderr);
-
-        // Provide specific recovery guidance based on error type
-        if stderr.contains("Permission denied") || stderr.contains("publickey") {
-            ui::print_error(&format!("SSH authentication failed for {}", repo.name));
-            ui::print_info("SSH key issues detected:");
-            ui::print_info("   • Test SSH connection: ssh -T git@github.com");
-            ui::print_info(
-                "   • Add SSH key to GitHub: gh auth refresh -h github.com -s admin:public_key",
-            );
-            anyhow::bail!("SSH authentication failed for repository '{}'", repo.name);
-        } else if stderr.contains("not found") || stderr.contains("does not exist") {
-            ui::print_error(&format!("Repository not found: {}", repo.name));
-            ui::print_info("Repository access issues:");
-            ui::print_info(&format!(
-                "   • Verify repository exists: gh repo view {}",
-                repo.name
-            ));
-            ui::print_info("   • Check repository URL in .viewyard-repos.json");
-            ui::print_info("   • Ensure you have access to this repository");
-            anyhow::bail!("Repository '{}' not found or inaccessible", repo.name);
-        }
-
-        anyhow::bail!("Failed to clone repository '{}': {}", repo.name, stderr);
+        error_handling::handle_clone_error(&repo.name, &stderr)?;
     }
 
     // Configure git user for the repository
@@ -732,7 +634,7 @@ fn update_viewset(account: Option<&str>) -> Result<()> {
 
     // Detect viewset context (must be in viewset root for update)
     let current_dir = std::env::current_dir()?;
-    let repos_file = current_dir.join(".viewyard-repos.json");
+    let repos_file = current_dir.join(models::REPOS_FILE_NAME);
 
     if !repos_file.exists() {
         ui::show_error_with_help(
@@ -748,7 +650,7 @@ fn update_viewset(account: Option<&str>) -> Result<()> {
     }
 
     // Load existing repositories
-    let existing_repos = load_and_validate_repos(&repos_file)?;
+    let existing_repos = workspace::load_and_validate_repos(&repos_file)?;
 
     // Discover available repositories
     let Ok(all_repos) = discover_repositories_for_viewset(account) else {
@@ -773,8 +675,7 @@ fn update_viewset(account: Option<&str>) -> Result<()> {
     updated_repos.extend(selected_repos.iter().cloned());
 
     // Update the repository configuration file
-    let repos_json = serde_json::to_string_pretty(&updated_repos)?;
-    std::fs::write(&repos_file, repos_json)?;
+    workspace::save_repositories(&repos_file, &updated_repos)?;
 
     ui::print_success(&format!(
         "Viewset updated successfully! Added {} new repositories.",
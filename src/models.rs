@@ -1,6 +1,9 @@
 use serde::{Deserialize, Serialize};
 use std::fmt;
 
+/// Name of the file that stores the repository list at the root of a viewset
+pub const REPOS_FILE_NAME: &str = ".viewyard-repos.json";
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Repository {
     pub name: String,
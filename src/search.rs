@@ -15,16 +15,22 @@ impl RepositorySearch {
     }
 
     /// Search repositories with fuzzy matching
-    pub fn search(&self, repositories: &[Repository], query: &str) -> Vec<(Repository, i64)> {
+    /// Matches borrow from `repositories`, so callers only clone what they keep
+    #[must_use]
+    pub fn search<'a>(
+        &self,
+        repositories: &'a [Repository],
+        query: &str,
+    ) -> Vec<(&'a Repository, i64)> {
         if query.trim().is_empty() {
-            return repositories.iter().map(|repo| (repo.clone(), 0)).collect();
+            return repositories.iter().map(|repo| (repo, 0)).collect();
         }
 
         let mut matches = Vec::new();
 
         for repo in repositories {
             if let Some(score) = self.matcher.fuzzy_match(&repo.name, query) {
-                matches.push((repo.clone(), score));
+                matches.push((repo, score));
             }
         }
 
@@ -35,47 +41,39 @@ impl RepositorySearch {
     }
 
     /// Group repositories by source for better display
+    #[must_use]
     pub fn group_by_source(
         repositories: &[Repository],
-    ) -> std::collections::BTreeMap<String, Vec<Repository>> {
+    ) -> std::collections::BTreeMap<String, Vec<&Repository>> {
         let mut groups = std::collections::BTreeMap::new();
 
         for repo in repositories {
-            let source_key = if repo.source.contains("GitHub (") {
-                // Extract account/org from "GitHub (account)" or "GitHub (org/account)"
-                repo.source.find("GitHub (").map_or_else(
-                    || repo.source.clone(),
-                    |start| {
-                        let after_github = &repo.source[start + 8..];
-                        after_github.find(')').map_or_else(
-                            || repo.source.clone(),
-                            |end| {
-                                let account_part = &after_github[..end];
-                                if account_part.contains('/') {
-                                    // Organization repo: "org/account"
-                                    let org =
-                                        account_part.split('/').next().unwrap_or(account_part);
-                                    format!("GitHub ({org})")
-                                } else {
-                                    // Personal repo: "account"
-                                    format!("GitHub ({account_part})")
-                                }
-                            },
-                        )
-                    },
-                )
-            } else {
-                repo.source.clone()
-            };
-
             groups
-                .entry(source_key)
+                .entry(Self::source_group_key(&repo.source))
                 .or_insert_with(Vec::new)
-                .push(repo.clone());
+                .push(repo);
         }
 
         groups
     }
+
+    /// Grouping key for a repository source, computed in a single pass over the string
+    /// "GitHub (account)" stays as is, "GitHub (org/account)" groups under "GitHub (org)"
+    fn source_group_key(source: &str) -> String {
+        source
+            .split_once("GitHub (")
+            .and_then(|(_, after_github)| after_github.split_once(')'))
+            .map_or_else(
+                || source.to_string(),
+                |(account_part, _)| {
+                    // Organization repos ("org/account") group under the organization
+                    let owner = account_part
+                        .split_once('/')
+                        .map_or(account_part, |(org, _)| org);
+                    format!("GitHub ({owner})")
+                },
+            )
+    }
 }
 
 impl Default for RepositorySearch {
@@ -125,4 +123,21 @@ mod tests {
         assert!(groups.contains_key("GitHub (dheater)"));
         assert!(groups.contains_key("GitHub (imprivata)"));
     }
+
+    #[test]
+    fn test_source_group_key() {
+        assert_eq!(
+            RepositorySearch::source_group_key("GitHub (dheater)"),
+            "GitHub (dheater)"
+        );
+        assert_eq!(
+            RepositorySearch::source_group_key("GitHub (imprivata/dheater) [private]"),
+            "GitHub (imprivata)"
+        );
+        assert_eq!(RepositorySearch::source_group_key("Local"), "Local");
+        assert_eq!(
+            RepositorySearch::source_group_key("GitHub (unterminated"),
+            "GitHub (unterminated"
+        );
+    }
 }
@@ -1,3 +1,6 @@
+use std::io::IsTerminal;
+use std::sync::OnceLock;
+
 /// ANSI color codes
 pub struct Colors;
 
@@ -11,14 +14,39 @@ impl Colors {
     pub const RESET: &'static str = "\x1b[0m";
 }
 
+/// Whether colors should be used on a stream, following the `NO_COLOR` convention
+fn color_enabled(is_terminal: bool) -> bool {
+    is_terminal && !matches!(std::env::var_os("NO_COLOR"), Some(value) if !value.is_empty())
+}
+
+/// Whether stdout gets colored output (checked once per process)
+fn stdout_color_enabled() -> bool {
+    static ENABLED: OnceLock<bool> = OnceLock::new();
+    *ENABLED.get_or_init(|| color_enabled(std::io::stdout().is_terminal()))
+}
+
+/// Whether stderr gets colored output (checked once per process)
+fn stderr_color_enabled() -> bool {
+    static ENABLED: OnceLock<bool> = OnceLock::new();
+    *ENABLED.get_or_init(|| color_enabled(std::io::stderr().is_terminal()))
+}
+
 /// Print colored text to stdout
 pub fn print_colored(text: &str, color: &str) {
-    println!("{}{}{}", color, text, Colors::RESET);
+    if stdout_color_enabled() {
+        println!("{}{}{}", color, text, Colors::RESET);
+    } else {
+        println!("{text}");
+    }
 }
 
 /// Print colored text to stderr
 pub fn eprint_colored(text: &str, color: &str) {
-    eprintln!("{}{}{}", color, text, Colors::RESET);
+    if stderr_color_enabled() {
+        eprintln!("{}{}{}", color, text, Colors::RESET);
+    } else {
+        eprintln!("{text}");
+    }
 }
 
 /// Print success message
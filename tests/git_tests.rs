@@ -1,48 +1,62 @@
 use anyhow::Result;
 use std::fs;
+use std::path::{Path, PathBuf};
 use std::process::Command;
 use tempfile::TempDir;
 use viewyard::git;
 
-/// Helper function to create a test repo with a remote that has a specific default branch
-fn create_test_repo_with_remote_default(remote_default: &str) -> Result<TempDir> {
-    let temp_dir = TempDir::new()?;
-    let repo_path = temp_dir.path();
+/// Test repository whose "remote" lives next to it under a single temporary root,
+/// so both are cleaned up together when the fixture is dropped
+struct TestRepo {
+    _root: TempDir,
+    path: PathBuf,
+}
 
-    // Create a bare repository to act as the "remote"
-    let remote_dir = TempDir::new()?;
-    let remote_path = remote_dir.path();
+impl TestRepo {
+    fn path(&self) -> &Path {
+        &self.path
+    }
+}
 
+/// Helper function to create a bare-bones test repo (just `git init`) for tests that need no remote
+fn create_test_repo() -> Result<TempDir> {
+    let temp_dir = TempDir::new()?;
     Command::new("git")
-        .args(["init", "--bare"])
-        .current_dir(remote_path)
+        .args(["init"])
+        .current_dir(temp_dir.path())
         .output()?;
+    Ok(temp_dir)
+}
 
-    // Set the default branch for the remote
+/// Helper function to create a test repo with a remote that has a specific default branch
+fn create_test_repo_with_remote_default(remote_default: &str) -> Result<TestRepo> {
+    let root = TempDir::new()?;
+    let repo_dir = root.path().join("repo");
+    let repo_path = repo_dir.as_path();
+
+    // Create a bare repository to act as the "remote", with the requested default branch
     Command::new("git")
         .args([
-            "symbolic-ref",
-            "HEAD",
-            &format!("refs/heads/{remote_default}"),
+            "init",
+            "--bare",
+            &format!("--initial-branch={remote_default}"),
+            "remote.git",
         ])
-        .current_dir(remote_path)
-        .output()?;
-
-    // Clone the bare repo to create our test repo
-    Command::new("git")
-        .args(["clone", remote_path.to_str().unwrap(), "."])
-        .current_dir(repo_path)
-        .output()?;
-
-    // Configure git user for the test
-    Command::new("git")
-        .args(["config", "user.name", "Test User"])
-        .current_dir(repo_path)
+        .current_dir(root.path())
         .output()?;
 
+    // Clone the bare repo to create our test repo, configuring the git user for the test
     Command::new("git")
-        .args(["config", "user.email", "test@example.com"])
-        .current_dir(repo_path)
+        .args([
+            "clone",
+            "-c",
+            "user.name=Test User",
+            "-c",
+            "user.email=test@example.com",
+            "remote.git",
+            "repo",
+        ])
+        .current_dir(root.path())
         .output()?;
 
     // Create initial commit
@@ -69,11 +83,10 @@ fn create_test_repo_with_remote_default(remote_default: &str) -> Result<TempDir>
         .current_dir(repo_path)
         .output()?;
 
-    // Keep the remote directory alive by leaking it
-    // This is a test-only hack to prevent the remote from being deleted
-    std::mem::forget(remote_dir);
-
-    Ok(temp_dir)
+    Ok(TestRepo {
+        _root: root,
+        path: repo_dir,
+    })
 }
 
 #[test]
@@ -116,15 +129,9 @@ fn test_get_default_branch_with_custom_branch() -> Result<()> {
 #[test]
 fn test_get_default_branch_prefers_main_over_master() -> Result<()> {
     // Test that when both main and master exist, main is preferred
-    let temp_dir = TempDir::new()?;
+    let temp_dir = create_test_repo()?;
     let repo_path = temp_dir.path();
 
-    // Initialize git repo
-    Command::new("git")
-        .args(["init"])
-        .current_dir(repo_path)
-        .output()?;
-
     // Create fake remote branches for both main and master
     let git_dir = repo_path.join(".git");
     let refs_remotes_dir = git_dir.join("refs").join("remotes").join("origin");
@@ -197,7 +204,7 @@ fn test_validate_repository_directory() -> Result<()> {
 fn test_git_config_operations() -> Result<()> {
     use viewyard::git::{get_git_config, set_git_config};
 
-    let temp_repo = create_test_repo_with_remote_default("main")?;
+    let temp_repo = create_test_repo()?;
     let repo_path = temp_repo.path();
 
     // Test setting and getting git config
@@ -217,7 +224,7 @@ fn test_validate_repository_for_operations() -> Result<()> {
     use viewyard::git::{get_git_config, validate_repository_for_operations};
     use viewyard::models::Repository;
 
-    let temp_repo = create_test_repo_with_remote_default("main")?;
+    let temp_repo = create_test_repo()?;
     let repo_path = temp_repo.path();
 
     // Create a test repository struct
@@ -247,7 +254,7 @@ fn test_validate_repository_with_explicit_account() -> Result<()> {
     use viewyard::git::{get_git_config, validate_repository_for_operations};
     use viewyard::models::Repository;
 
-    let temp_repo = create_test_repo_with_remote_default("main")?;
+    let temp_repo = create_test_repo()?;
     let repo_path = temp_repo.path();
 
     // Create a test repository struct with explicit account field
@@ -276,25 +283,10 @@ fn test_validate_repository_with_explicit_account() -> Result<()> {
 fn test_signing_key_configuration() -> Result<()> {
     use viewyard::git::{get_git_config, set_git_config, validate_and_configure_git_user};
 
-    let temp_repo = create_test_repo_with_remote_default("main")?;
+    let temp_repo = create_test_repo()?;
     let repo_path = temp_repo.path();
 
-    // SAFE: Set up a mock signing key in a separate test repository to simulate global config
-    // This avoids modifying the user's actual global git configuration
-    let mock_global_repo = TempDir::new()?;
-    let mock_global_path = mock_global_repo.path();
-
-    // Initialize a mock "global" repository for testing
-    std::process::Command::new("git")
-        .args(["init"])
-        .current_dir(mock_global_path)
-        .output()?;
-
-    // Set signing key in the mock repository (simulates global config)
-    set_git_config("user.signingkey", "~/.ssh/test_key.pub", mock_global_path)?;
-
-    // Test the signing key detection by temporarily overriding the function
-    // For this test, we'll manually set the signing key in the target repo
+    // SAFE: Set the signing key locally in the target repo rather than in global config
     set_git_config("user.signingkey", "~/.ssh/test_key.pub", repo_path)?;
 
     // Test validation - should configure git user but preserve existing signing key
@@ -331,49 +323,27 @@ fn test_signing_key_detection() -> Result<()> {
     Ok(())
 }
 
+/// Read a global git config value directly through git, bypassing viewyard
+fn read_global_git_config(key: &str) -> Option<String> {
+    Command::new("git")
+        .args(["config", "--global", key])
+        .output()
+        .ok()
+        .filter(|output| output.status.success())
+        .map(|output| String::from_utf8_lossy(&output.stdout).trim().to_string())
+}
+
 #[test]
 fn test_global_config_never_modified() -> Result<()> {
     use viewyard::git::{set_git_config, validate_and_configure_git_user};
 
-    let temp_repo = create_test_repo_with_remote_default("main")?;
+    let temp_repo = create_test_repo()?;
     let repo_path = temp_repo.path();
 
     // Capture initial global git config state (if any)
-    let initial_global_name = std::process::Command::new("git")
-        .args(["config", "--global", "user.name"])
-        .output()
-        .ok()
-        .and_then(|output| {
-            if output.status.success() {
-                Some(String::from_utf8_lossy(&output.stdout).trim().to_string())
-            } else {
-                None
-            }
-        });
-
-    let initial_global_email = std::process::Command::new("git")
-        .args(["config", "--global", "user.email"])
-        .output()
-        .ok()
-        .and_then(|output| {
-            if output.status.success() {
-                Some(String::from_utf8_lossy(&output.stdout).trim().to_string())
-            } else {
-                None
-            }
-        });
-
-    let initial_global_signing_key = std::process::Command::new("git")
-        .args(["config", "--global", "user.signingkey"])
-        .output()
-        .ok()
-        .and_then(|output| {
-            if output.status.success() {
-                Some(String::from_utf8_lossy(&output.stdout).trim().to_string())
-            } else {
-                None
-            }
-        });
+    let initial_global_name = read_global_git_config("user.name");
+    let initial_global_email = read_global_git_config("user.email");
+    let initial_global_signing_key = read_global_git_config("user.signingkey");
 
     // Perform viewyard operations that configure git
     validate_and_configure_git_user(repo_path, "testuser")?;
@@ -381,41 +351,9 @@ fn test_global_config_never_modified() -> Result<()> {
     set_git_config("user.email", "test@example.com", repo_path)?;
 
     // Verify global git config is unchanged
-    let final_global_name = std::process::Command::new("git")
-        .args(["config", "--global", "user.name"])
-        .output()
-        .ok()
-        .and_then(|output| {
-            if output.status.success() {
-                Some(String::from_utf8_lossy(&output.stdout).trim().to_string())
-            } else {
-                None
-            }
-        });
-
-    let final_global_email = std::process::Command::new("git")
-        .args(["config", "--global", "user.email"])
-        .output()
-        .ok()
-        .and_then(|output| {
-            if output.status.success() {
-                Some(String::from_utf8_lossy(&output.stdout).trim().to_string())
-            } else {
-                None
-            }
-        });
-
-    let final_global_signing_key = std::process::Command::new("git")
-        .args(["config", "--global", "user.signingkey"])
-        .output()
-        .ok()
-        .and_then(|output| {
-            if output.status.success() {
-                Some(String::from_utf8_lossy(&output.stdout).trim().to_string())
-            } else {
-                None
-            }
-        });
+    let final_global_name = read_global_git_config("user.name");
+    let final_global_email = read_global_git_config("user.email");
+    let final_global_signing_key = read_global_git_config("user.signingkey");
 
     // Assert that global config is completely unchanged
     assert_eq!(
@@ -457,3 +395,35 @@ fn test_transform_github_url_for_account() {
     let unchanged_gitlab = git::transform_github_url_for_account(gitlab_url, "dheater");
     assert_eq!(unchanged_gitlab, gitlab_url);
 }
+
+#[test]
+fn test_parse_ssh_host_aliases() {
+    let config = "\
+Host github.com-dheater
+    HostName github.com
+    User git
+    IdentityFile ~/.ssh/id_personal
+
+Host github.com-work
+    HostName github.com
+    IdentityFile ~/.ssh/id_work
+
+Host gitlab.com-dheater
+    HostName gitlab.com
+
+Host example
+    HostName example.com
+";
+
+    let aliases = git::parse_ssh_host_aliases(config);
+
+    assert_eq!(aliases.len(), 2);
+    assert_eq!(aliases["dheater"], "github.com-dheater");
+    assert_eq!(aliases["work"], "github.com-work");
+}
+
+#[test]
+fn test_parse_ssh_host_aliases_without_github_hosts() {
+    assert!(git::parse_ssh_host_aliases("").is_empty());
+    assert!(git::parse_ssh_host_aliases("Host github.com\n    HostName github.com\n").is_empty());
+}
@@ -28,44 +28,21 @@ fn test_create_viewset_with_github_cli_unavailable() {
 }
 
 #[test]
-fn test_workspace_status_outside_view() {
+fn test_workspace_commands_outside_view() {
     let temp_dir = TempDir::new().unwrap();
 
-    let mut cmd = Command::cargo_bin("viewyard").unwrap();
-    cmd.arg("status").current_dir(temp_dir.path());
-
-    // Should fail gracefully when not in a view
-    cmd.assert()
-        .failure()
-        .stderr(predicates::str::contains("view directory"));
-}
-
-#[test]
-fn test_workspace_commit_all_outside_view() {
-    let temp_dir = TempDir::new().unwrap();
-
-    let mut cmd = Command::cargo_bin("viewyard").unwrap();
-    cmd.arg("commit-all")
-        .arg("test message")
-        .current_dir(temp_dir.path());
-
-    // Should fail gracefully when not in a view
-    cmd.assert()
-        .failure()
-        .stderr(predicates::str::contains("view directory"));
-}
-
-#[test]
-fn test_workspace_push_all_outside_view() {
-    let temp_dir = TempDir::new().unwrap();
+    let workspace_commands: [&[&str]; 3] =
+        [&["status"], &["commit-all", "test message"], &["push-all"]];
 
-    let mut cmd = Command::cargo_bin("viewyard").unwrap();
-    cmd.arg("push-all").current_dir(temp_dir.path());
+    for args in workspace_commands {
+        let mut cmd = Command::cargo_bin("viewyard").unwrap();
+        cmd.args(args).current_dir(temp_dir.path());
 
-    // Should fail gracefully when not in a view
-    cmd.assert()
-        .failure()
-        .stderr(predicates::str::contains("view directory"));
+        // Should fail gracefully when not in a view
+        cmd.assert()
+            .failure()
+            .stderr(predicates::str::contains("view directory"));
+    }
 }
 
 #[test]
@@ -196,13 +173,9 @@ fn test_hierarchical_view_detection() {
     ]"#;
     fs::write(viewset_dir.join(".viewyard-repos.json"), repos_json).unwrap();
 
-    // Create mock git repositories (just .git directories)
-    let repo1_dir = view_dir.join("repo1");
-    let repo2_dir = view_dir.join("repo2");
-    fs::create_dir_all(&repo1_dir).unwrap();
-    fs::create_dir_all(&repo2_dir).unwrap();
-    fs::create_dir_all(repo1_dir.join(".git")).unwrap();
-    fs::create_dir_all(repo2_dir.join(".git")).unwrap();
+    // Create mock git repositories (just .git directories, parents created implicitly)
+    fs::create_dir_all(view_dir.join("repo1").join(".git")).unwrap();
+    fs::create_dir_all(view_dir.join("repo2").join(".git")).unwrap();
 
     // Test status command in the view directory
     let mut cmd = Command::cargo_bin("viewyard").unwrap();
@@ -221,9 +194,8 @@ fn test_directory_without_git_repos_fails() {
 
     // Create a directory with no git repositories
     let empty_dir = temp_dir.path().join("empty-dir");
-    fs::create_dir_all(&empty_dir).unwrap();
 
-    // Create some non-git directories
+    // Create some non-git directories (also creates the empty directory itself)
     fs::create_dir_all(empty_dir.join("not-a-repo")).unwrap();
     fs::write(empty_dir.join("some-file.txt"), "content").unwrap();
 
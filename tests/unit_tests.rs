@@ -1,4 +1,9 @@
-use viewyard::models::Repository;
+use std::path::Path;
+use viewyard::commands::workspace::{
+    load_and_validate_repos, parse_and_validate_repos, save_repositories,
+};
+use viewyard::github::{parse_active_account, parse_auth_status};
+use viewyard::models::{Repository, REPOS_FILE_NAME};
 use viewyard::search::RepositorySearch;
 
 /// Helper function to create test repositories with minimal boilerplate
@@ -26,20 +31,8 @@ fn test_repository_creation() {
 fn test_repository_search_fuzzy_matching() {
     let search = RepositorySearch::new();
     let repos = vec![
-        Repository {
-            name: "my-awesome-project".to_string(),
-            url: "https://github.com/test/my-awesome-project.git".to_string(),
-            is_private: false,
-            source: "GitHub (test)".to_string(),
-            account: None,
-        },
-        Repository {
-            name: "another-project".to_string(),
-            url: "https://github.com/test/another-project.git".to_string(),
-            is_private: false,
-            source: "GitHub (test)".to_string(),
-            account: None,
-        },
+        create_test_repo("my-awesome-project", "GitHub (test)", false),
+        create_test_repo("another-project", "GitHub (test)", false),
     ];
 
     let results = search.search(&repos, "awesome");
@@ -49,55 +42,42 @@ fn test_repository_search_fuzzy_matching() {
 }
 
 #[test]
-fn test_repository_search_empty_query() {
+fn test_repository_search_matches() {
     let search = RepositorySearch::new();
     let repos = vec![
-        Repository {
-            name: "repo1".to_string(),
-            url: "https://github.com/test/repo1.git".to_string(),
-            is_private: false,
-            source: "GitHub (test)".to_string(),
-            account: None,
-        },
-        Repository {
-            name: "repo2".to_string(),
-            url: "https://github.com/test/repo2.git".to_string(),
-            is_private: false,
-            source: "GitHub (test)".to_string(),
-            account: None,
-        },
+        create_test_repo("repo1", "GitHub (test)", false),
+        create_test_repo("repo2", "GitHub (test)", false),
+        create_test_repo("special-project", "GitHub (test)", false),
+    ];
+
+    // (query, expected matching repository names)
+    let cases: [(&str, &[&str]); 4] = [
+        ("", &["repo1", "repo2", "special-project"]),
+        ("repo1", &["repo1"]),
+        ("special", &["special-project"]),
+        ("nonexistent", &[]),
     ];
 
-    let results = search.search(&repos, "");
-    assert_eq!(results.len(), 2); // Should return all repositories
-    assert_eq!(results[0].1, 0); // Score should be 0 for empty query
-    assert_eq!(results[1].1, 0);
+    for (query, expected) in cases {
+        let results = search.search(&repos, query);
+        let mut names: Vec<&str> = results.iter().map(|(repo, _)| repo.name.as_str()).collect();
+        names.sort_unstable();
+        assert_eq!(names, expected, "query: {query:?}");
+    }
+
+    // Empty query returns everything unscored
+    assert!(search
+        .search(&repos, "")
+        .iter()
+        .all(|(_, score)| *score == 0));
 }
 
 #[test]
 fn test_repository_grouping_by_source() {
     let repos = vec![
-        Repository {
-            name: "repo1".to_string(),
-            url: "https://github.com/user/repo1.git".to_string(),
-            is_private: false,
-            source: "GitHub (user)".to_string(),
-            account: None,
-        },
-        Repository {
-            name: "repo2".to_string(),
-            url: "https://github.com/user/repo2.git".to_string(),
-            is_private: false,
-            source: "GitHub (user)".to_string(),
-            account: None,
-        },
-        Repository {
-            name: "repo3".to_string(),
-            url: "https://github.com/org/repo3.git".to_string(),
-            is_private: false,
-            source: "GitHub (org/user)".to_string(),
-            account: None,
-        },
+        create_test_repo("repo1", "GitHub (user)", false),
+        create_test_repo("repo2", "GitHub (user)", false),
+        create_test_repo("repo3", "GitHub (org/user)", false),
     ];
 
     let groups = RepositorySearch::group_by_source(&repos);
@@ -111,21 +91,8 @@ fn test_repository_grouping_by_source() {
 
 #[test]
 fn test_repository_private_flag() {
-    let private_repo = Repository {
-        name: "private-repo".to_string(),
-        url: "https://github.com/user/private-repo.git".to_string(),
-        is_private: true,
-        source: "GitHub (user) [private]".to_string(),
-        account: None,
-    };
-
-    let public_repo = Repository {
-        name: "public-repo".to_string(),
-        url: "https://github.com/user/public-repo.git".to_string(),
-        is_private: false,
-        source: "GitHub (user)".to_string(),
-        account: None,
-    };
+    let private_repo = create_test_repo("private-repo", "GitHub (user) [private]", true);
+    let public_repo = create_test_repo("public-repo", "GitHub (user)", false);
 
     assert!(private_repo.is_private);
     assert!(!public_repo.is_private);
@@ -137,27 +104,9 @@ fn test_repository_private_flag() {
 fn test_repository_search_scoring() {
     let search = RepositorySearch::new();
     let repos = vec![
-        Repository {
-            name: "exact-match".to_string(),
-            url: "https://github.com/test/exact-match.git".to_string(),
-            is_private: false,
-            source: "GitHub (test)".to_string(),
-            account: None,
-        },
-        Repository {
-            name: "partial-exact-match".to_string(),
-            url: "https://github.com/test/partial-exact-match.git".to_string(),
-            is_private: false,
-            source: "GitHub (test)".to_string(),
-            account: None,
-        },
-        Repository {
-            name: "no-match-here".to_string(),
-            url: "https://github.com/test/no-match-here.git".to_string(),
-            is_private: false,
-            source: "GitHub (test)".to_string(),
-            account: None,
-        },
+        create_test_repo("exact-match", "GitHub (test)", false),
+        create_test_repo("partial-exact-match", "GitHub (test)", false),
+        create_test_repo("no-match-here", "GitHub (test)", false),
     ];
 
     let results = search.search(&repos, "exact");
@@ -174,21 +123,6 @@ fn test_repository_search_scoring() {
     }
 }
 
-#[test]
-fn test_repository_search_no_matches() {
-    let search = RepositorySearch::new();
-    let repos = vec![Repository {
-        name: "repo1".to_string(),
-        url: "https://github.com/test/repo1.git".to_string(),
-        is_private: false,
-        source: "GitHub (test)".to_string(),
-        account: None,
-    }];
-
-    let results = search.search(&repos, "nonexistent");
-    assert_eq!(results.len(), 0);
-}
-
 #[test]
 fn test_repository_search_with_large_dataset() {
     let search = RepositorySearch::new();
@@ -196,29 +130,113 @@ fn test_repository_search_with_large_dataset() {
     // Generate a large number of repositories to test performance
     let mut repos = Vec::new();
     for i in 0..1000 {
-        repos.push(Repository {
-            name: format!("repo-{i:04}"),
-            url: format!("https://github.com/test/repo-{i:04}.git"),
-            is_private: i % 3 == 0, // Every third repo is private
-            source: if i % 2 == 0 {
-                "GitHub (user)".to_string()
-            } else {
-                "GitHub (org/user)".to_string()
-            },
-            account: None,
-        });
+        let source = if i % 2 == 0 {
+            "GitHub (user)"
+        } else {
+            "GitHub (org/user)"
+        };
+        // Every third repo is private
+        repos.push(create_test_repo(
+            &format!("repo-{i:04}"),
+            source,
+            i % 3 == 0,
+        ));
     }
 
     // Add a specific repository to search for
-    repos.push(Repository {
-        name: "special-project".to_string(),
-        url: "https://github.com/test/special-project.git".to_string(),
-        is_private: false,
-        source: "GitHub (user)".to_string(),
-        account: None,
-    });
+    repos.push(create_test_repo("special-project", "GitHub (user)", false));
 
     let results = search.search(&repos, "special");
     assert_eq!(results.len(), 1);
     assert_eq!(results[0].0.name, "special-project");
 }
+
+#[test]
+fn test_parse_and_validate_repos() {
+    let repos_json = r#"[
+        {
+            "name": "repo1",
+            "url": "https://github.com/user/repo1.git",
+            "is_private": false,
+            "source": "GitHub (user)"
+        },
+        {
+            "name": "repo2",
+            "url": "https://github.com/org/repo2.git",
+            "is_private": true,
+            "source": "GitHub (org/user) [private]",
+            "account": "user"
+        }
+    ]"#;
+
+    let repos = parse_and_validate_repos(repos_json, Path::new(REPOS_FILE_NAME)).unwrap();
+    assert_eq!(repos.len(), 2);
+    assert_eq!(repos[0].name, "repo1");
+    assert_eq!(repos[0].account, None);
+    assert!(repos[1].is_private);
+    assert_eq!(repos[1].account.as_deref(), Some("user"));
+}
+
+#[test]
+fn test_save_repositories_round_trip() {
+    let temp_dir = tempfile::TempDir::new().unwrap();
+    let repos_file = temp_dir.path().join(REPOS_FILE_NAME);
+    let repos = vec![
+        create_test_repo("repo1", "GitHub (user)", false),
+        create_test_repo("repo2", "GitHub (org/user) [private]", true),
+    ];
+
+    save_repositories(&repos_file, &repos).unwrap();
+    let loaded = load_and_validate_repos(&repos_file).unwrap();
+
+    assert_eq!(loaded.len(), 2);
+    assert_eq!(loaded[0].name, "repo1");
+    assert_eq!(loaded[1].source, "GitHub (org/user) [private]");
+    assert!(loaded[1].is_private);
+}
+
+#[test]
+fn test_parse_and_validate_repos_rejects_invalid_entries() {
+    let file = Path::new(REPOS_FILE_NAME);
+
+    let invalid_json = parse_and_validate_repos("not json", file).unwrap_err();
+    assert!(invalid_json.to_string().contains("Invalid JSON"));
+
+    let empty_name = r#"[{"name": " ", "url": "https://github.com/user/repo.git", "is_private": false, "source": "GitHub (user)"}]"#;
+    let error = parse_and_validate_repos(empty_name, file).unwrap_err();
+    assert!(error.to_string().contains("'name' field cannot be empty"));
+
+    let empty_url =
+        r#"[{"name": "repo", "url": "", "is_private": false, "source": "GitHub (user)"}]"#;
+    let error = parse_and_validate_repos(empty_url, file).unwrap_err();
+    assert!(error.to_string().contains("'url' field cannot be empty"));
+}
+
+#[test]
+fn test_parse_auth_status() {
+    let status_output = "github.com
+  ✓ Logged in to github.com account work-user (keyring)
+  - Active account: true
+  - Git operations protocol: ssh
+  - Token: gho_************************************
+
+  ✓ Logged in to github.com account personal-user (keyring)
+  - Active account: false
+  - Git operations protocol: https
+";
+
+    assert_eq!(
+        parse_auth_status(status_output),
+        vec!["work-user".to_string(), "personal-user".to_string()]
+    );
+    assert!(parse_auth_status("You are not logged into any GitHub hosts.").is_empty());
+
+    assert_eq!(
+        parse_active_account(status_output).as_deref(),
+        Some("work-user")
+    );
+    assert_eq!(
+        parse_active_account(&status_output.replace("true", "false")),
+        None
+    );
+}